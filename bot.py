@@ -17,13 +17,17 @@ Features:
 
 import discord
 import gspread
+import requests
+import io
 import os
 import asyncio
 import aiohttp
+import time
 import json
+from collections import Counter
+from dataclasses import dataclass
 from discord.ext import commands, tasks
 from dotenv import load_dotenv
-from oauth2client.service_account import ServiceAccountCredentials
 from auto_sync_outline import auto_sync_outline_command
 
 # ============================================================================
@@ -80,9 +84,259 @@ if not SHEET_ID:
 # ============================================================================
 
 scope = ["https://spreadsheets.google.com/feeds", "https://www.googleapis.com/auth/drive"]
-creds = ServiceAccountCredentials.from_json_keyfile_name("credentials.json", scope)
-client = gspread.authorize(creds)
-sheet = client.open_by_key(SHEET_ID).worksheet(WORKSHEET_NAME)
+# gspread.service_account uses google-auth credentials, which refresh
+# their token transparently — a long-lived bot never hits a surprise
+# auth failure mid-command the way a stale oauth2client token could
+client = gspread.service_account(filename="credentials.json", scopes=scope)
+
+# Pool and reuse the underlying TCP/TLS connection across all Sheets calls
+# so each sheet operation doesn't pay a fresh handshake. gspread 6 moved
+# the requests session from Client.session to Client.http_client.session.
+_gspread_session = getattr(client, "http_client", client).session
+_gspread_session.mount("https://", requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
+# Opening the spreadsheet is network I/O; defer it so importing this
+# module stays instant and the gateway connection isn't delayed behind
+# Google. on_ready resolves these before any task or command runs.
+spreadsheet = None
+sheet = None
+
+def _init_sheet():
+    """Open the spreadsheet and worksheet (blocking; run in a thread)."""
+    global spreadsheet, sheet
+    if sheet is None:
+        spreadsheet = client.open_by_key(SHEET_ID)
+        sheet = spreadsheet.worksheet(WORKSHEET_NAME)
+    return sheet
+
+async def _ensure_sheet():
+    """
+    Open the sheet on first use if it isn't open yet.
+
+    on_ready initializes the sheet, but that can fail (or an interaction
+    can arrive before it finishes); retrying here means commands raise a
+    real gspread error into their own error handling instead of dying on
+    sheet being None.
+    """
+    if sheet is None:
+        await asyncio.to_thread(_init_sheet)
+
+# Cache of the full sheet contents, keyed by the spreadsheet's Drive
+# modification time so we only re-download when the sheet actually changed.
+_records_cache = {"data": None, "last_update": None, "ts": 0.0}
+
+async def _sheet_call(fn, *args, **kwargs):
+    """
+    Run a blocking gspread call in a worker thread.
+
+    gspread does synchronous HTTPS I/O; calling it directly on the event
+    loop stalls Discord heartbeats and every other command while Google
+    responds. Offloading to a thread keeps the loop responsive.
+    """
+    return await asyncio.to_thread(fn, *args, **kwargs)
+
+async def _sheet_call_with_backoff(fn, *args, tries=5, **kwargs):
+    """
+    Run a blocking gspread call, retrying transient API errors.
+
+    Sheets rate-limits writes (60/min/user), so a 429 during a bulk promote
+    is normal; retry with exponential backoff instead of failing the whole
+    command. Non-transient errors are re-raised immediately.
+    """
+    delay = 1
+    for attempt in range(tries):
+        try:
+            return await _sheet_call(fn, *args, **kwargs)
+        except gspread.exceptions.APIError as e:
+            status = e.response.status_code
+            if status in (429, 500, 502, 503) and attempt < tries - 1:
+                print(f"⚠️  Sheets API error {status}, retrying in {delay}s...")
+                await asyncio.sleep(delay)
+                delay *= 2
+            else:
+                raise
+
+def _sheet_last_update():
+    """Get the spreadsheet's Drive modification time, or None if unavailable."""
+    try:
+        # get_lastUpdateTime() asks Drive every call; the lastUpdateTime
+        # property caches its first answer forever, which would make the
+        # change gate skip every sheet edit after startup
+        return spreadsheet.get_lastUpdateTime()
+    except Exception as e:
+        print(f"⚠️  Could not check sheet modification time: {e}")
+        return None
+
+async def _fetch_records(ttl=60):
+    """
+    Get all records from the sheet, re-downloading only when the
+    spreadsheet has changed since the last fetch.
+
+    Within the TTL window the cached records are returned without even a
+    metadata round-trip, so back-to-back flows like "sync then promote"
+    pay for exactly one download.
+
+    Args:
+        ttl (int): Seconds for which cached records are served as-is
+
+    Returns:
+        list: The cached or freshly fetched sheet records
+    """
+    now = time.monotonic()
+    if _records_cache["data"] is not None and now - _records_cache["ts"] < ttl:
+        return _records_cache["data"]
+
+    await _ensure_sheet()
+    last_update = await _sheet_call(_sheet_last_update)
+    if (_records_cache["data"] is None
+            or last_update is None
+            or last_update != _records_cache["last_update"]):
+        _records_cache["data"] = await _sheet_call(sheet.get_all_records)
+        _records_cache["last_update"] = last_update
+    _records_cache["ts"] = now
+    return _records_cache["data"]
+
+def _invalidate_records_cache():
+    """Drop the cached sheet records (call after any sheet write)."""
+    _records_cache["data"] = None
+
+def _chunk_lines(lines, limit=1900):
+    """
+    Yield message chunks of at most `limit` characters from an iterable of
+    newline-terminated lines, splitting only at line boundaries.
+
+    Args:
+        lines: Iterable of strings to pack into chunks
+        limit (int): Maximum characters per yielded chunk
+
+    Yields:
+        str: The next message-sized chunk
+    """
+    buf = []
+    size = 0
+    for line in lines:
+        if buf and size + len(line) > limit:
+            yield "".join(buf)
+            buf = []
+            size = 0
+        buf.append(line)
+        size += len(line)
+    if buf:
+        yield "".join(buf)
+
+# Resolved sheet column indices; the sheet schema rarely changes, so the
+# header row is re-fetched at most once an hour. Also carries the
+# username → row index for the Discord column on a shorter TTL.
+_col_cache = {"ts": 0.0, "status": None, "discord": None,
+              "rows_ts": 0.0, "row_by_user": None, "row_count": 0}
+
+# Accepted header spellings for the two columns the bot writes to
+STATUS_HEADER_NAMES = frozenset({"status", "state"})
+DISCORD_HEADER_NAMES = frozenset({"discord username", "discord", "username"})
+
+async def _resolve_cols(ttl=3600):
+    """
+    Resolve the Status and Discord Username column indices, cached.
+
+    Args:
+        ttl (int): Seconds before the header row is re-fetched
+
+    Returns:
+        tuple: (status_col, discord_col); either may be None if not found
+    """
+    now = time.monotonic()
+    if (_col_cache["status"] and _col_cache["discord"]
+            and now - _col_cache["ts"] < ttl):
+        return _col_cache["status"], _col_cache["discord"]
+
+    await _ensure_sheet()
+    headers = await _sheet_call(sheet.row_values, 1)
+    status_col = None
+    discord_col = None
+    for i, header in enumerate(headers, 1):  # gspread uses 1-indexed
+        header_lower = header.lower().strip()
+        if status_col is None and header_lower in STATUS_HEADER_NAMES:
+            status_col = i
+        if discord_col is None and header_lower in DISCORD_HEADER_NAMES:
+            discord_col = i
+        if status_col and discord_col:
+            break
+
+    _col_cache["ts"] = now
+    _col_cache["status"] = status_col
+    _col_cache["discord"] = discord_col
+    return status_col, discord_col
+
+async def _resolve_rows(ttl=300):
+    """
+    Get the username → row-number index for the Discord column, cached.
+
+    New rows written by the bot are added to the index incrementally, so
+    interactive commands don't re-download the column per invocation.
+
+    Args:
+        ttl (int): Seconds before the column is re-fetched
+
+    Returns:
+        tuple: (row_by_user dict or None, row count)
+    """
+    now = time.monotonic()
+    if (_col_cache["row_by_user"] is not None
+            and now - _col_cache["rows_ts"] < ttl):
+        return _col_cache["row_by_user"], _col_cache["row_count"]
+
+    # Derive the index from the cached records when possible — after a
+    # sync or promote pre-sync those are already in memory, so this costs
+    # no network at all
+    records = await _fetch_records()
+    discord_key = None
+    if records:
+        discord_key = next((k for k in records[0]
+                            if k.strip().lower() in DISCORD_HEADER_NAMES), None)
+
+    row_by_user = {}
+    if discord_key:
+        # Records start at sheet row 2 (row 1 is the header)
+        for i, rec in enumerate(records, 2):
+            uname = str(rec.get(discord_key, "")).strip().lower()
+            if uname:
+                row_by_user.setdefault(uname, i)
+        row_count = len(records) + 1
+    else:
+        # Fall back to a direct column read when the records are empty
+        _, discord_col = await _resolve_cols()
+        if not discord_col:
+            return None, 0
+        discord_values = await _sheet_call_with_backoff(sheet.col_values, discord_col)
+        for i, v in enumerate(discord_values, 1):
+            row_by_user.setdefault(v.strip().lower(), i)
+        row_count = len(discord_values)
+
+    _col_cache["row_by_user"] = row_by_user
+    _col_cache["row_count"] = row_count
+    _col_cache["rows_ts"] = now
+    return row_by_user, row_count
+
+def _values_to_records(values):
+    """
+    Convert a raw values range (first row = headers) into the list-of-dicts
+    shape that get_all_records produces.
+
+    Args:
+        values (list): Rows as returned by a Sheets values batchGet
+
+    Returns:
+        list: One dict per data row, keyed by the header row
+    """
+    if not values:
+        return []
+    headers = values[0]
+    records = []
+    for row in values[1:]:
+        # Sheets drops trailing empty cells, so pad rows to header width
+        padded = row + [''] * (len(headers) - len(row))
+        records.append(dict(zip(headers, padded)))
+    return records
 
 # ============================================================================
 # DISCORD BOT SETUP
@@ -121,68 +375,130 @@ class OutlineAPI:
             'Authorization': f'Bearer {api_token}',
             'Content-Type': 'application/json'
         }
-    
-    async def _make_request(self, endpoint, data=None):
+        # Shared aiohttp session, created lazily on first request so it
+        # binds to the running event loop; reusing it keeps the TCP/TLS
+        # connection alive across calls instead of handshaking every time
+        self._session = None
+        # Short-TTL caches for users and groups: memberships change
+        # rarely, so back-to-back syncs reuse the same responses
+        self._users_cache = None
+        self._users_ts = 0.0
+        self._groups_cache = None
+        self._groups_ts = 0.0
+        # Casefolded name → object maps derived from the caches above,
+        # rebuilt only when the underlying cache refreshes
+        self._user_by_name = None
+        self._group_by_name = None
+        # Bound concurrent requests so gathered sync waves stay within
+        # Outline's rate limit
+        self._sem = asyncio.Semaphore(10)
+
+    async def _get_session(self):
+        """Get the shared HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            # Default headers live on the session so aiohttp doesn't
+            # re-merge a per-call header dict on every request
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=10),
+                headers=self.headers
+            )
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP session (called on bot shutdown)."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def _make_request(self, endpoint, data=None, tries=4):
         """
         Make an HTTP request to Outline API.
-        
+
+        Transient failures (429/5xx) are retried with exponential backoff,
+        honouring Retry-After when the server sends one, and all requests
+        share a semaphore so gathered calls don't stampede the API.
+
         Args:
             endpoint (str): The API endpoint to call (e.g., 'users.list', 'groups.list')
             data (dict, optional): JSON data to send with the request
-            
+            tries (int): Maximum attempts before giving up
+
         Returns:
             dict: The JSON response from the API, or None if failed
         """
         url = f"{self.api_url}/{endpoint}"
-        
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.post(url, headers=self.headers, json=data or {}) as response:
-                    response_text = await response.text()
-                    print(f"🔍 Outline API {endpoint}: Status {response.status}")
-                    print(f"🔍 Response: {response_text[:500]}...")
-                    
-                    if response.status == 200:
-                        try:
-                            return await response.json()
-                        except:
-                            # If response is not JSON, try to parse the text we already got
-                            import json as json_module
-                            return json_module.loads(response_text)
+
+        session = await self._get_session()
+        delay = 1
+        for attempt in range(tries):
+            async with self._sem:
+                try:
+                    async with session.post(url, json=data or {}) as response:
+                        response_text = await response.text()
+                        print(f"🔍 Outline API {endpoint}: Status {response.status}")
+                        print(f"🔍 Response: {response_text[:500]}...")
+
+                        if response.status == 200:
+                            try:
+                                return await response.json()
+                            except:
+                                # If response is not JSON, try to parse the text we already got
+                                import json as json_module
+                                return json_module.loads(response_text)
+
+                        if response.status in (429, 500, 502, 503) and attempt < tries - 1:
+                            wait = float(response.headers.get('Retry-After', delay))
+                            print(f"⚠️  Outline API {response.status}, retrying in {wait}s...")
+                        else:
+                            print(f"❌ Outline API error {response.status}: {response_text}")
+                            return None
+                except Exception as e:
+                    if attempt < tries - 1:
+                        wait = delay
+                        print(f"⚠️  Request failed ({e}), retrying in {wait}s...")
                     else:
-                        print(f"❌ Outline API error {response.status}: {response_text}")
+                        print(f"❌ Request failed: {str(e)}")
                         return None
-            except Exception as e:
-                print(f"❌ Request failed: {str(e)}")
-                return None
+
+            await asyncio.sleep(wait)
+            delay *= 2
     
-    async def get_users(self):
-        """Get all users from Outline with pagination support."""
+    async def get_users(self, ttl=60):
+        """Get all users from Outline with pagination support (cached)."""
+        if (self._users_cache is not None
+                and time.monotonic() - self._users_ts < ttl):
+            return self._users_cache
+
         all_users = []
         offset = 0
         limit = 25
-        
+        complete = False
+
         while True:
             # Make request with pagination parameters
             response = await self._make_request('users.list', {'offset': offset, 'limit': limit})
-            
+
             if not response or 'data' not in response:
                 break
-                
+
             users = response['data']
             all_users.extend(users)
-            
+
             # Check if there are more pages
             pagination = response.get('pagination', {})
             total = pagination.get('total', 0)
-            
+
             if len(all_users) >= total or not pagination.get('nextPath'):
+                complete = True
                 break
-                
+
             offset += limit
-        
+
+        if not complete and not all_users:
+            # Nothing usable fetched; report failure so callers can bail
+            return None
+
         # Return in the same format as the original API response
-        return {
+        result = {
             'data': all_users,
             'pagination': {
                 'total': len(all_users),
@@ -191,10 +507,77 @@ class OutlineAPI:
             },
             'ok': True
         }
-    
-    async def get_groups(self):
-        """Get all groups from Outline."""
-        return await self._make_request('groups.list')
+        if complete:
+            self._users_cache = result
+            self._users_ts = time.monotonic()
+            self._user_by_name = None
+        else:
+            # A page failed mid-fetch: hand back the partial roster but
+            # don't cache it, so the next call retries the full download
+            print(f"⚠️ Outline users fetch incomplete ({len(all_users)} users); not caching")
+        return result
+
+    async def get_groups(self, ttl=60):
+        """Get all groups from Outline (cached)."""
+        if (self._groups_cache is not None
+                and time.monotonic() - self._groups_ts < ttl):
+            return self._groups_cache
+
+        response = await self._make_request('groups.list')
+        if response:
+            self._groups_cache = response
+            self._groups_ts = time.monotonic()
+            self._group_by_name = None
+        return response
+
+    @staticmethod
+    def _extract_list(response, key):
+        """Pull the item list out of Outline's (sometimes nested) response."""
+        if not response or 'data' not in response:
+            return []
+        data = response['data']
+        if isinstance(data, dict) and key in data:
+            return data[key]
+        return data if isinstance(data, list) else []
+
+    async def get_user_map(self):
+        """
+        Get a {casefolded name: user} map, or None if the fetch failed.
+
+        The map is rebuilt only when the users cache refreshes.
+        """
+        response = await self.get_users()
+        if not response:
+            return None
+        if response is not self._users_cache:
+            # Partial (uncached) fetch: build a one-off map rather than
+            # memoizing a truncated roster until the next cache refresh
+            return {
+                u['name'].casefold(): u
+                for u in self._extract_list(response, 'users') if u.get('name')
+            }
+        if self._user_by_name is None:
+            self._user_by_name = {
+                u['name'].casefold(): u
+                for u in self._extract_list(response, 'users') if u.get('name')
+            }
+        return self._user_by_name
+
+    async def get_group_map(self):
+        """
+        Get a {casefolded name: group} map, or None if the fetch failed.
+
+        The map is rebuilt only when the groups cache refreshes.
+        """
+        response = await self.get_groups()
+        if not response:
+            return None
+        if self._group_by_name is None:
+            self._group_by_name = {
+                g['name'].casefold(): g
+                for g in self._extract_list(response, 'groups') if g.get('name')
+            }
+        return self._group_by_name
     
     async def create_group(self, name, description=None):
         """
@@ -212,7 +595,11 @@ class OutlineAPI:
         }
         if description:
             data['description'] = description
-        return await self._make_request('groups.create', data)
+        response = await self._make_request('groups.create', data)
+        if response:
+            # The cached group list no longer reflects reality
+            self._groups_cache = None
+        return response
     
     async def add_user_to_group(self, user_id, group_id):
         """
@@ -293,6 +680,114 @@ if OUTLINE_API_URL and OUTLINE_API_TOKEN:
 # BOT EVENT HANDLERS
 # ============================================================================
 
+# Members indexed by lowercased username and display name, scoped per
+# guild (guild.id → {name: member}) and maintained incrementally from
+# gateway events so commands don't re-scan guild.members per invocation.
+# Per-guild scoping keeps multi-guild installs honest: a user who only
+# shares a different server with the bot must not match here.
+_name_index = {}
+_display_index = {}
+
+def _index_guild_member(member):
+    """Add one member to their guild's name indexes."""
+    _name_index.setdefault(member.guild.id, {})[member.name.casefold()] = member
+    _display_index.setdefault(member.guild.id, {})[member.display_name.casefold()] = member
+
+def _member_names_of(guild):
+    """Get the (username index, display-name index) for one guild."""
+    return _name_index.get(guild.id, {}), _display_index.get(guild.id, {})
+
+def _rebuild_member_index():
+    """Rebuild the member name indexes from scratch (called on startup)."""
+    _name_index.clear()
+    _display_index.clear()
+    for guild in bot.guilds:
+        for member in guild.members:
+            _index_guild_member(member)
+
+@bot.event
+async def on_member_join(member):
+    """Keep the member name indexes current when someone joins."""
+    _index_guild_member(member)
+    # The newcomer may be one of the cached misses; let the next sync
+    # re-check everyone
+    _missing_members.clear()
+
+@bot.event
+async def on_member_remove(member):
+    """Keep the member name indexes current when someone leaves."""
+    guild_names = _name_index.get(member.guild.id)
+    if guild_names:
+        guild_names.pop(member.name.casefold(), None)
+    guild_displays = _display_index.get(member.guild.id)
+    if guild_displays:
+        guild_displays.pop(member.display_name.casefold(), None)
+
+# Per-guild role-name → role dicts, built lazily and invalidated by the
+# role gateway events, so handlers get O(1) role lookups without
+# re-indexing guild.roles each invocation.
+_role_cache = {}
+
+def _roles_of(guild):
+    """Get the cached {role name: role} dict for a guild."""
+    cached = _role_cache.get(guild.id)
+    if cached is None:
+        cached = {r.name: r for r in guild.roles}
+        _role_cache[guild.id] = cached
+    return cached
+
+@bot.event
+async def on_guild_role_create(role):
+    """Invalidate the role cache when a role is created."""
+    _role_cache.pop(role.guild.id, None)
+
+@bot.event
+async def on_guild_role_delete(role):
+    """Invalidate the role cache when a role is deleted."""
+    _role_cache.pop(role.guild.id, None)
+
+@bot.event
+async def on_guild_role_update(before, after):
+    """Invalidate the role cache when a role is renamed or changed."""
+    _role_cache.pop(after.guild.id, None)
+
+@bot.event
+async def on_member_update(before, after):
+    """Keep the member name indexes current across nickname changes."""
+    guild_names, guild_displays = _member_names_of(after.guild)
+    guild_names.pop(before.name.casefold(), None)
+    guild_displays.pop(before.display_name.casefold(), None)
+    _index_guild_member(after)
+
+@bot.event
+async def on_user_update(before, after):
+    """
+    Keep the member name indexes current across username changes.
+
+    Username and global-name edits dispatch here, not on_member_update
+    (that only covers per-guild nick/role changes), so without this the
+    indexes would go stale after any rename.
+    """
+    for guild in bot.guilds:
+        member = guild.get_member(after.id)
+        if member is not None:
+            guild_names, guild_displays = _member_names_of(guild)
+            guild_names.pop(before.name.casefold(), None)
+            guild_displays.pop(before.display_name.casefold(), None)
+            _index_guild_member(member)
+
+@bot.event
+async def on_guild_join(guild):
+    """Index the members of guilds joined after startup."""
+    for member in guild.members:
+        _index_guild_member(member)
+
+@bot.event
+async def on_guild_remove(guild):
+    """Drop a departed guild's name indexes."""
+    _name_index.pop(guild.id, None)
+    _display_index.pop(guild.id, None)
+
 @bot.event
 async def on_ready():
     """
@@ -313,8 +808,19 @@ async def on_ready():
     except Exception as e:
         print(f"❌ Failed to sync slash commands: {e}")
     
-    # Start the auto sync task
+    # Open the sheet off the event loop now that the gateway is up
+    try:
+        await asyncio.to_thread(_init_sheet)
+        print(f"📊 Opened worksheet '{WORKSHEET_NAME}'")
+    except Exception as e:
+        print(f"❌ Failed to open Google Sheet: {e}")
+
+    # Build the member name indexes once at startup
+    _rebuild_member_index()
+
+    # Start the auto sync task and the background cache refresher
     auto_sync_roles.start()
+    refresh_sheet_cache.start()
 
 # ============================================================================
 # OUTLINE INTEGRATION COMMANDS
@@ -335,8 +841,8 @@ async def list_roles_slash(interaction: discord.Interaction):
     """
     guild = interaction.guild
     
-    # Get all roles except @everyone
-    roles = [role for role in guild.roles if role.name != "@everyone"]
+    # Get all roles except @everyone (match by identity, not display name)
+    roles = [role for role in guild.roles if not role.is_default()]
     
     if not roles:
         await interaction.response.send_message("📭 No roles found in this server")
@@ -344,28 +850,28 @@ async def list_roles_slash(interaction: discord.Interaction):
     
     # Sort roles by position (highest first)
     roles.sort(key=lambda r: r.position, reverse=True)
-    
-    # Create role list with member counts
+
+    # Count members per role in one pass over the guild; each
+    # role.members access would re-scan every member per role
+    role_counts = Counter()
+    for m in guild.members:
+        role_counts.update(m._roles)
+
+    # Create role list with member counts. member._roles never includes
+    # the default role, so @everyone's count is the guild size
     role_info = []
     for role in roles:
-        member_count = len(role.members)
+        member_count = guild.member_count if role.is_default() else role_counts[role.id]
         role_info.append(f"• **{role.name}** ({member_count} members)")
     
     # Split into chunks if too long
     role_text = "\n".join(role_info)
     if len(role_text) > 1900:  # Discord message limit is 2000
-        # Send in multiple messages
+        # Send in multiple messages, packed at line boundaries by the
+        # shared chunker instead of per-line string concatenation
         await interaction.response.send_message(f"🎭 **Server Roles ({len(roles)} total):**")
-        
-        chunk = ""
-        for info in role_info:
-            if len(chunk + info + "\n") > 1900:
-                await interaction.followup.send(chunk)
-                chunk = info + "\n"
-            else:
-                chunk += info + "\n"
-        
-        if chunk:
+
+        for chunk in _chunk_lines(info + "\n" for info in role_info):
             await interaction.followup.send(chunk)
     else:
         await interaction.response.send_message(f"🎭 **Server Roles ({len(roles)} total):**\n{role_text}")
@@ -458,39 +964,18 @@ async def sync_outline_slash(interaction: discord.Interaction, role_name: str =
     try:
         guild = interaction.guild
         
-        # Get Outline users and groups
-        outline_users_response = await outline_api.get_users()
-        outline_groups_response = await outline_api.get_groups()
-        
-        if not outline_users_response or not outline_groups_response:
+        # Get the casefolded Outline user and group maps, built once per
+        # cache refresh; the two endpoints are independent, so fetch them
+        # concurrently
+        outline_user_map, outline_group_map = await asyncio.gather(
+            outline_api.get_user_map(),
+            outline_api.get_group_map()
+        )
+
+        if outline_user_map is None or outline_group_map is None:
             await interaction.followup.send("❌ Failed to fetch data from Outline API")
             return
         
-        # Handle nested response structure for users
-        users_data = outline_users_response.get('data', {})
-        if isinstance(users_data, dict) and 'users' in users_data:
-            outline_users = users_data['users']
-        else:
-            outline_users = users_data if isinstance(users_data, list) else []
-        
-        # Handle nested response structure for groups  
-        groups_data = outline_groups_response.get('data', {})
-        if isinstance(groups_data, dict) and 'groups' in groups_data:
-            outline_groups = groups_data['groups']
-        else:
-            outline_groups = groups_data if isinstance(groups_data, list) else []
-        
-        # Create username mapping for Outline users
-        outline_user_map = {}
-        for user in outline_users:
-            # Try to extract Discord username from Outline user
-            username = user.get('name', '').lower()
-            if username:
-                outline_user_map[username] = user
-        
-        # Create group mapping for Outline groups
-        outline_group_map = {group.get('name', '').lower(): group for group in outline_groups}
-        
         sync_results = []
         
         if role_name and group_name:
@@ -537,34 +1022,40 @@ async def _sync_role_to_group(guild, role_name, group_name, outline_user_map, ou
         return f"❌ Discord role '{role_name}' not found"
     
     # Find Outline group
-    group = outline_group_map.get(group_name.lower())
+    group = outline_group_map.get(group_name.casefold())
     if not group:
         return f"❌ Outline group '{group_name}' not found"
     
     # Get Discord members with this role
     discord_members = role.members
-    
+
     sync_count = 0
     error_count = 0
-    
+
+    # Split members into matched and unmatched first, then fire the
+    # add-user calls concurrently so total latency is one round-trip
+    # wave instead of one round-trip per member
+    matched = []
     for member in discord_members:
-        # Try to find matching Outline user by username
-        username = member.name.lower()
-        outline_user = outline_user_map.get(username)
-        
+        outline_user = outline_user_map.get(member.name.casefold())
         if outline_user:
-            # Add user to group
-            result = await outline_api.add_user_to_group(outline_user['id'], group['id'])
-            if result:
-                sync_count += 1
-                print(f"✅ Added {member.name} to Outline group '{group_name}'")
-            else:
-                error_count += 1
-                print(f"❌ Failed to add {member.name} to Outline group '{group_name}'")
+            matched.append((member, outline_user))
         else:
             error_count += 1
             print(f"❌ No matching Outline user found for Discord user '{member.name}'")
-    
+
+    results = await asyncio.gather(
+        *(outline_api.add_user_to_group(user['id'], group['id']) for _, user in matched),
+        return_exceptions=True
+    )
+    for (member, _), result in zip(matched, results):
+        if result and not isinstance(result, Exception):
+            sync_count += 1
+            print(f"✅ Added {member.name} to Outline group '{group_name}'")
+        else:
+            error_count += 1
+            print(f"❌ Failed to add {member.name} to Outline group '{group_name}'")
+
     return f"🎭 **{role_name}** → **{group_name}**: {sync_count} synced, {error_count} errors"
 
 # ============================================================================
@@ -599,8 +1090,11 @@ async def checkapps_slash(interaction: discord.Interaction):
     Args:
         interaction: The Discord interaction object
     """
-    rows = sheet.get_all_records()
-    await interaction.response.send_message(f"Found {len(rows)} applications.")
+    # Defer up front: a cold cache means a full sheet download, which can
+    # exceed Discord's 3-second interaction window
+    await interaction.response.defer(thinking=True)
+    rows = await _fetch_records()
+    await interaction.followup.send(f"Found {len(rows)} applications.")
     
     if rows:
         latest = rows[-1]
@@ -622,7 +1116,9 @@ async def sync_roles_slash(interaction: discord.Interaction):
     Args:
         interaction: The Discord interaction object
     """
-    await interaction.response.send_message("🔄 Syncing roles...")
+    # Defer up front: the sheet fetch can easily exceed Discord's 3-second
+    # interaction window
+    await interaction.response.defer(thinking=True)
     await _sync_roles_internal(interaction.guild)
     await interaction.followup.send("✅ Role sync complete.")
 
@@ -638,8 +1134,11 @@ async def promote_slash(interaction: discord.Interaction):
     Args:
         interaction: The Discord interaction object
     """
-    await interaction.response.send_message("🔁 Promoting roles: Incoming → Active, Active → Previous...")
-    
+    # Defer up front: the pre-sync and sheet updates take well over the
+    # 3-second interaction window
+    await interaction.response.defer(thinking=True)
+    await interaction.followup.send("🔁 Promoting roles: Incoming → Active, Active → Previous...")
+
     # First sync with Google Sheet to ensure consistency
     await interaction.followup.send("📋 Syncing with Google Sheet first...")
     
@@ -649,72 +1148,147 @@ async def promote_slash(interaction: discord.Interaction):
     await interaction.followup.send("✅ Pre-sync complete. Now promoting roles...")
 
     guild = interaction.guild
-    incoming_role = discord.utils.get(guild.roles, name="Incoming")
-    active_role = discord.utils.get(guild.roles, name="Active")
-    previous_role = discord.utils.get(guild.roles, name="Previous")
+    # Cached role index (invalidated by role events)
+    roles_by_name = _roles_of(guild)
+    incoming_role = roles_by_name.get("Incoming")
+    active_role = roles_by_name.get("Active")
+    previous_role = roles_by_name.get("Previous")
 
-    # Track changes for sheet updates
-    sheet_updates = []
+    # Precompile the status role IDs so each member needs one set
+    # intersection instead of three scans of member.roles
+    status_ids = frozenset(r.id for r in (incoming_role, active_role, previous_role) if r)
+
+    # Role edits are collected first, then dispatched concurrently; each
+    # carries the sheet updates to queue only if its edit succeeds
+    role_edits = []
 
     for member in guild.members:
-        member_updated = False
-        
+        held = status_ids.intersection(member._roles)
+        if not held:
+            continue
+
         # Previous role users remain unchanged
-        if previous_role in member.roles:
+        if previous_role and previous_role.id in held:
             print(f"{member.name}: Previous (no change)")
             continue
 
-        if active_role in member.roles:
-            await member.remove_roles(active_role)
-            await member.add_roles(previous_role)
-            print(f"{member.name}: Active → Previous")
-            # Update sheet: Active → Previous
-            sheet_updates.append((member.name, "Previous"))
-            member_updated = True
-
-        if incoming_role in member.roles:
-            await member.remove_roles(incoming_role)
-            await member.add_roles(active_role)
-            print(f"{member.name}: Incoming → Active")
-            # Update sheet: Incoming → Active
-            sheet_updates.append((member.name, "Active"))
-            member_updated = True
+        # Compute the member's final role list and apply it in one PATCH
+        # rather than a remove_roles/add_roles pair per transition
+        new_roles = [r for r in member.roles
+                     if not r.is_default() and r.id not in status_ids]
+        member_updates = []
+
+        if active_role and active_role.id in held:
+            if previous_role:
+                new_roles.append(previous_role)
+                print(f"{member.name}: Active → Previous")
+                # Update sheet: Active → Previous
+                member_updates.append((member.name, "Previous"))
+            else:
+                print(f"⚠️ 'Previous' role not found; leaving {member.name} as Active")
+
+        if incoming_role and incoming_role.id in held:
+            if active_role:
+                new_roles.append(active_role)
+                print(f"{member.name}: Incoming → Active")
+                # Update sheet: Incoming → Active
+                member_updates.append((member.name, "Active"))
+            else:
+                print(f"⚠️ 'Active' role not found; leaving {member.name} as Incoming")
+
+        if member_updates:
+            role_edits.append((member, new_roles, member_updates))
+
+    async def _promote_edit(member, new_roles):
+        async with _edit_sem:
+            await member.edit(roles=new_roles, reason="semester promotion")
+
+    results = await asyncio.gather(*(_promote_edit(m, nr) for m, nr, _ in role_edits),
+                                   return_exceptions=True)
+
+    # Only members whose Discord edit actually went through get their
+    # sheet row updated; failures are reported instead of swallowed
+    sheet_updates = []
+    edit_failures = 0
+    for (member, _, member_updates), result in zip(role_edits, results):
+        if isinstance(result, Exception):
+            edit_failures += 1
+            print(f"❌ Failed to update roles for {member.name}: {result}")
+        else:
+            sheet_updates.extend(member_updates)
+
+    if edit_failures:
+        await interaction.followup.send(
+            f"⚠️ {edit_failures} member role edit(s) failed (check bot permissions "
+            f"and role hierarchy); their sheet rows were left unchanged"
+        )
 
     # Update Google Sheet
     if sheet_updates:
         await interaction.followup.send("📝 Updating Google Sheet...")
         sheet_success = False
         try:
-            # Find the Status column
-            headers = sheet.row_values(1)
-            status_col = None
-            discord_col = None
-            
-            for i, header in enumerate(headers):
-                if header.lower() in ['status', 'state']:
-                    status_col = i + 1  # gspread uses 1-indexed
-                if header.lower() in ['discord username', 'discord', 'username']:
-                    discord_col = i + 1
-            
+            # Find the Status and Discord Username columns (cached)
+            status_col, discord_col = await _resolve_cols()
+
             if status_col and discord_col:
-                # Get all Discord usernames at once to avoid multiple API calls
-                discord_values = sheet.col_values(discord_col)
-                
+                # Cached username → row index shared with setstatus; saves
+                # re-downloading the Discord column per promote
+                name_to_row, _ = await _resolve_rows()
+                if name_to_row is None:
+                    name_to_row = {}
+
+                # Current sheet statuses from the cached records so writes
+                # that would just restate the existing value are dropped
+                current_status = {}
+                for rec in await _fetch_records():
+                    uname = str(rec.get("Discord Username", "")).strip().lower()
+                    if uname:
+                        current_status.setdefault(uname, str(rec.get("Status", "")))
+
+                # Collect all cell edits and push them as one batched write
+                # instead of one API round-trip per promoted member
+                updates = []
                 for discord_name, new_status in sheet_updates:
-                    # Find the row with this Discord username
+                    if current_status.get(discord_name.lower()) == new_status:
+                        print(f"⏭️ Sheet already shows {discord_name} as {new_status}, skipping")
+                        continue
+                    row_num = name_to_row.get(discord_name.lower())
+                    if row_num:
+                        updates.append((row_num, new_status))
+                        print(f"📝 Queued sheet update: {discord_name} → {new_status}")
+
+                if updates:
+                    # Coalesce contiguous rows into ranged writes: a dense
+                    # promotion collapses to a handful of D2:D57-style
+                    # ranges in a single batch RPC
+                    updates.sort()
+                    status_col_a1 = gspread.utils.rowcol_to_a1(1, status_col)[:-1]
+                    data = []
+                    run_start = prev_row = None
+                    run_values = []
+                    for row_num, new_status in updates:
+                        if run_values and row_num == prev_row + 1:
+                            run_values.append([new_status])
+                        else:
+                            if run_values:
+                                data.append({"range": f"{status_col_a1}{run_start}:{status_col_a1}{prev_row}",
+                                             "values": run_values})
+                            run_start = row_num
+                            run_values = [[new_status]]
+                        prev_row = row_num
+                    data.append({"range": f"{status_col_a1}{run_start}:{status_col_a1}{prev_row}",
+                                 "values": run_values})
+
                     try:
-                        # Find the row number for this Discord username
-                        for row_num, cell_value in enumerate(discord_values, 1):
-                            if cell_value.strip().lower() == discord_name.lower():
-                                # Update the status in that row
-                                sheet.update_cell(row_num, status_col, new_status)
-                                print(f"📝 Updated sheet: {discord_name} → {new_status}")
-                                break
+                        await _sheet_call_with_backoff(sheet.batch_update, data, value_input_option='USER_ENTERED')
+                        print(f"📝 Updated {len(updates)} sheet rows across {len(data)} ranges in one batch")
                     except Exception as e:
-                        print(f"❌ Error updating sheet for {discord_name}: {e}")
-                        await interaction.followup.send(f"⚠️ Failed to update sheet for {discord_name}: Network error")
+                        print(f"❌ Error batch-updating sheet: {e}")
+                        await interaction.followup.send("⚠️ Failed to update sheet: Network error")
                 
                 sheet_success = True
+                _invalidate_records_cache()
             else:
                 await interaction.followup.send("❌ Could not find 'Status' or 'Discord Username' columns in sheet")
                 
@@ -744,52 +1318,52 @@ async def setstatus_slash(interaction: discord.Interaction, member: discord.Memb
         member: The Discord member to update
         status: The new status to assign
     """
-    await interaction.response.send_message(f"🔄 Setting {member.mention}'s status to {status}...")
+    # Defer up front: the role edit plus sheet update can exceed Discord's
+    # 3-second interaction window
+    await interaction.response.defer(thinking=True)
+    await interaction.followup.send(f"🔄 Setting {member.mention}'s status to {status}...")
     
     guild = interaction.guild
-    role = discord.utils.get(guild.roles, name=status)
-    
+    roles_by_name = _roles_of(guild)
+    role = roles_by_name.get(status)
+
     if role:
-        # Remove all status roles first
-        status_roles = ["Incoming", "Active", "Previous"]
-        for status_role_name in status_roles:
-            status_role = discord.utils.get(guild.roles, name=status_role_name)
-            if status_role and status_role in member.roles:
-                await member.remove_roles(status_role)
-        
-        # Add new role
-        await member.add_roles(role)
+        # Apply the status through the shared sync path
+        status_role_objs = [roles_by_name.get(n) for n in STATUS_ROLE_NAMES]
+        await apply_status(member, role, status_role_objs)
         print(f"✅ Assigned {role.name} to {member.name}")
         
         # Update Google Sheet
         try:
-            headers = sheet.row_values(1)
-            status_col = None
-            discord_col = None
-            
-            for i, header in enumerate(headers):
-                if header.lower() in ['status', 'state']:
-                    status_col = i + 1
-                if header.lower() in ['discord username', 'discord', 'username']:
-                    discord_col = i + 1
-            
+            # Find the Status and Discord Username columns (cached)
+            status_col, discord_col = await _resolve_cols()
+
             if status_col and discord_col:
-                discord_values = sheet.col_values(discord_col)
-                
-                user_found = False
-                for row_num, cell_value in enumerate(discord_values, 1):
-                    if cell_value.strip().lower() == member.name.lower():
-                        sheet.update_cell(row_num, status_col, status)
-                        print(f"📝 Updated sheet: {member.name} → {status}")
-                        await interaction.followup.send(f"✅ Updated {member.name} status to {status} in both Discord and sheet!")
-                        user_found = True
-                        break
-                
-                if not user_found:
+                # Cached username → row index instead of a fresh column
+                # download per invocation
+                name_to_row, row_count = await _resolve_rows()
+
+                row_num = name_to_row.get(member.name.lower()) if name_to_row else None
+                if row_num:
+                    await _sheet_call_with_backoff(sheet.update_cell, row_num, status_col, status)
+                    _invalidate_records_cache()
+                    print(f"📝 Updated sheet: {member.name} → {status}")
+                    await interaction.followup.send(f"✅ Updated {member.name} status to {status} in both Discord and sheet!")
+                else:
                     # Add new user to sheet with known information
-                    next_row = len(discord_values) + 1
-                    sheet.update_cell(next_row, discord_col, member.name)
-                    sheet.update_cell(next_row, status_col, status)
+                    next_row = row_count + 1
+                    # Write both cells of the new row in a single batch
+                    await _sheet_call_with_backoff(
+                        sheet.update_cells,
+                        [gspread.Cell(next_row, discord_col, member.name),
+                         gspread.Cell(next_row, status_col, status)],
+                        value_input_option='USER_ENTERED'
+                    )
+                    _invalidate_records_cache()
+                    # Keep the row index current without a re-download
+                    if _col_cache["row_by_user"] is not None:
+                        _col_cache["row_by_user"].setdefault(member.name.lower(), next_row)
+                        _col_cache["row_count"] = next_row
                     print(f"📝 Added new user to sheet: {member.name} → {status}")
                     await interaction.followup.send(f"✅ Updated {member.name} status to {status} in Discord and added to sheet!\n⚠️ **Please complete the remaining information for {member.name} in the Google Sheet.**")
             else:
@@ -799,24 +1373,79 @@ async def setstatus_slash(interaction: discord.Interaction, member: discord.Memb
             await interaction.followup.send(f"❌ Error updating Google Sheet: {e}")
             print(f"Sheet update error: {e}")
     else:
-        await interaction.followup.send(f"❌ Role '{status}' not found. Available roles: {[r.name for r in guild.roles if r.name in ['Incoming', 'Active', 'Previous']]}")
+        await interaction.followup.send(f"❌ Role '{status}' not found. Available roles: {[r.name for r in guild.roles if r.name in STATUS_ROLE_NAMES]}")
 
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
 
+# The three status roles a member cycles through
+STATUS_ROLE_NAMES = frozenset({"Incoming", "Active", "Previous"})
+
+# Bound concurrent role edits so parallel syncs stay under Discord's
+# per-route rate limit
+_edit_sem = asyncio.Semaphore(10)
+
+async def apply_status(member, role, status_role_objs):
+    """
+    Apply a status role to a member, removing any other status roles.
+
+    This is the single shared hot path for all role-sync call sites, so any
+    optimization here benefits manual sync, auto sync, and setstatus alike.
+
+    Args:
+        member: The Discord member to update
+        role: The target status role to assign
+        status_role_objs: Pre-resolved status role objects for this guild
+
+    Returns:
+        bool: True if the member was changed, False if already correct
+    """
+    # Snapshot member.roles once (the property rebuilds a list per access)
+    # and do the already-correct check against a role-ID set
+    current_roles = member.roles
+    role_ids = {r.id for r in current_roles}
+    if role.id in role_ids:
+        return False
+
+    # Swap the status roles atomically with a single PATCH instead of
+    # separate remove_roles/add_roles round-trips per role
+    status_ids = {r.id for r in status_role_objs if r}
+    new_roles = [r for r in current_roles
+                 if not r.is_default() and r.id not in status_ids]
+    new_roles.append(role)
+    async with _edit_sem:
+        await member.edit(roles=new_roles, reason="status sync")
+    return True
+
+# Sheet usernames recently confirmed absent from the server, so hourly
+# syncs don't rediscover (and re-log) the same misses every run.
+# username → expiry timestamp; cleared when someone joins.
+_missing_members = {}
+
 async def _sync_roles_internal(guild):
     """
     Internal function to sync roles without interaction responses.
-    
+
     This function handles the core logic for synchronizing Discord roles
     with Google Sheets data without sending interaction responses.
-    
+
     Args:
         guild: The Discord guild object
     """
-    data = sheet.get_all_records()
+    data = await _fetch_records()
+
+    # Index members and roles once so each sheet row is an O(1) dict hit
+    # instead of a linear scan over the whole guild
+    members_by_name = {m.name: m for m in guild.members}
+    roles_by_name = {r.name: r for r in guild.roles}
+
+    # Resolve the status roles once for the whole sync
+    status_role_objs = [roles_by_name.get(n) for n in STATUS_ROLE_NAMES]
 
+    # Collect the per-member work, then dispatch the role edits
+    # concurrently (apply_status bounds concurrency via the semaphore)
+    pending = []
     for entry in data:
         username = entry.get("Discord Username")
         status = entry.get("Status")
@@ -824,48 +1453,97 @@ async def _sync_roles_internal(guild):
         if not username or not status:
             continue
 
-        member = discord.utils.get(guild.members, name=username)
+        # Skip names already known to be absent (negative cache)
+        if _missing_members.get(username, 0) > time.time():
+            continue
+
+        member = members_by_name.get(username)
         if not member:
             print(f"❌ Member not found: {username}")
+            _missing_members[username] = time.time() + 3600
             continue
 
-        role = discord.utils.get(guild.roles, name=status)
+        role = roles_by_name.get(status)
         if role:
-            # Check if user already has the correct role
-            if role in member.roles:
-                print(f"⏭️ {username} already has {role.name} role, skipping")
-                continue
-            
-            # Remove all status roles first to avoid multiple roles
-            status_roles = ["Incoming", "Active", "Previous"]
-            for status_role_name in status_roles:
-                status_role = discord.utils.get(guild.roles, name=status_role_name)
-                if status_role and status_role in member.roles:
-                    await member.remove_roles(status_role)
-            
-            # Add new role
-            await member.add_roles(role)
-            print(f"✅ Assigned {role.name} to {username}")
+            pending.append((username, role, member))
         else:
             print(f"❌ Role not found: {status}")
 
+    async def _apply(username, role, member):
+        if await apply_status(member, role, status_role_objs):
+            print(f"✅ Assigned {role.name} to {username}")
+        else:
+            print(f"⏭️ {username} already has {role.name} role, skipping")
+
+    results = await asyncio.gather(*(_apply(u, r, m) for u, r, m in pending),
+                                   return_exceptions=True)
+    failures = 0
+    for (username, _, _), result in zip(pending, results):
+        if isinstance(result, Exception):
+            failures += 1
+            print(f"❌ Failed to sync roles for {username}: {result}")
+    if failures:
+        print(f"⚠️ Role sync finished with {failures} failed edit(s)")
+
 # ============================================================================
 # AUTOMATED TASKS
 # ============================================================================
 
-@tasks.loop(hours=24)
+# Prevents overlapping sync runs: the hourly tick can fire while a manual
+# or startup sync is still in flight
+_sync_lock = asyncio.Lock()
+
+async def auto_sync_roles_once():
+    """
+    Run one full role sync across all guilds.
+
+    Skips when a sync is already running (single-instance guard) or when
+    the sheet hasn't changed since the last sync.
+    """
+    if _sync_lock.locked():
+        print("⏭️ Sync already in progress, skipping this tick")
+        return
+
+    async with _sync_lock:
+        # Skip the sync entirely when the sheet hasn't changed since last run
+        last_update = await _sheet_call(_sheet_last_update)
+        if (last_update is not None
+                and _records_cache["data"] is not None
+                and last_update == _records_cache["last_update"]):
+            print("⏭️ Sheet unchanged since last sync, skipping auto-sync")
+            return
+
+        print("🔁 Auto-sync running...")
+        for guild in bot.guilds:
+            await _sync_roles_internal(guild)
+        print("✅ Automated role sync complete.")
+
+@tasks.loop(hours=1)
 async def auto_sync_roles():
     """
-    Automated task to sync roles every 24 hours.
-    
-    This task automatically synchronizes Discord roles with Google Sheets
-    data on a daily basis to ensure consistency without manual intervention.
+    Hourly safety tick for the automated role sync.
+
+    tasks.loop runs its first iteration as soon as it starts, so any sync
+    missed while the bot was down is caught up on startup; the lock in
+    auto_sync_roles_once keeps concurrent runs from overlapping.
     """
     await bot.wait_until_ready()
-    print("🔁 Auto-sync running...")
-    for guild in bot.guilds:
-        await _sync_roles_internal(guild)
-    print("✅ Automated role sync complete.")
+    await auto_sync_roles_once()
+
+@tasks.loop(minutes=5)
+async def refresh_sheet_cache():
+    """
+    Keep the sheet records cache warm in the background.
+
+    _fetch_records(ttl=0) re-checks the spreadsheet's modification time
+    and re-downloads only when it changed, so interactive commands almost
+    always hit the in-memory copy instead of paying a Sheets round-trip.
+    """
+    await bot.wait_until_ready()
+    try:
+        await _fetch_records(ttl=0)
+    except Exception as e:
+        print(f"⚠️ Background sheet cache refresh failed: {e}")
 
 # ============================================================================
 # ROLE INTERSECTION COMMANDS
@@ -889,11 +1567,15 @@ async def who_intersection_slash(interaction: discord.Interaction, role1_name: s
         await interaction.response.send_message(f"❌ Role '{role2_name}' not found")
         return
     
-    # Find intersection of members with both roles
-    intersection_number = 0
-    for member in guild.members:
-        if role1 in member.roles and role2 in member.roles:
-            intersection_number += 1
+    # Walk the smaller role's member list and test the other role's ID
+    # against each member's internal snowflake list — no set build, no
+    # repeated role.members materialization
+    members1, members2 = role1.members, role2.members
+    if len(members1) <= len(members2):
+        smaller, other_id = members1, role2.id
+    else:
+        smaller, other_id = members2, role1.id
+    intersection_number = sum(1 for member in smaller if other_id in member._roles)
     
     if intersection_number == 0:
         await interaction.response.send_message(f"📭 No members found with both '{role1_name}' and '{role2_name}' roles")
@@ -921,24 +1603,53 @@ async def ping_intersection_slash(interaction: discord.Interaction, role1_name:
         await interaction.response.send_message(f"❌ Role '{role2_name}' not found")
         return
     
-    # Find intersection of members with both roles
-    intersection_members = []
-    for member in guild.members:
-        if role1 in member.roles and role2 in member.roles:
-            intersection_members.append(member)
+    # Walk the smaller role's member list and test the other role's ID
+    # against each member's internal snowflake list — no set build, no
+    # repeated role.members materialization
+    members1, members2 = role1.members, role2.members
+    if len(members1) <= len(members2):
+        smaller, other_id = members1, role2.id
+    else:
+        smaller, other_id = members2, role1.id
+    intersection_members = [member for member in smaller if other_id in member._roles]
     
     if not intersection_members:
         await interaction.response.send_message(f"📭 No members found with both '{role1_name}' and '{role2_name}' roles")
         return
     
-    # Create mention string
-    mentions = " ".join([member.mention for member in intersection_members])
-    
+    # Chunk mentions by both Discord's ~100-mention cap and the 2000-char
+    # message limit so large intersections don't get rejected outright
+    chunks = []
+    current = []
+    current_len = 0
+    for member in intersection_members:
+        mention = member.mention
+        if current and (len(current) >= 90 or current_len + len(mention) + 1 > 1900):
+            chunks.append(" ".join(current))
+            current = []
+            current_len = 0
+        current.append(mention)
+        current_len += len(mention) + 1
+    if current:
+        chunks.append(" ".join(current))
+
     # Send message with mentions
-    await interaction.response.send_message(f"🔔 **Pinging members with both {role1_name} and {role2_name} roles:**\n{mentions}")
-    
+    await interaction.response.send_message(f"🔔 **Pinging members with both {role1_name} and {role2_name} roles:**\n{chunks[0]}")
+    for chunk in chunks[1:]:
+        await interaction.followup.send(chunk)
+
     print(f"✅ Pinged {len(intersection_members)} members with roles {role1_name} & {role2_name}")
 
+# Per-row result record for check-sheet-members; slots keep a
+# thousands-of-rows check to a fraction of the dict-based footprint
+@dataclass(slots=True)
+class SheetMember:
+    row: int
+    name: str
+    discord_username: str = ""
+    uwaterloo_email: str = ""
+    matched_member: discord.Member = None
+
 @bot.tree.command(name="check-sheet-members", description="Check if Google Sheet members are in Discord server (all worksheets)")
 @discord.app_commands.default_permissions(manage_roles=True)
 async def check_sheet_members_slash(interaction: discord.Interaction):
@@ -953,14 +1664,13 @@ async def check_sheet_members_slash(interaction: discord.Interaction):
     
     try:
         # Get the Google Sheet (spreadsheet object)
-        spreadsheet = client.open_by_key(SHEET_ID)
+        spreadsheet = await _sheet_call(client.open_by_key, SHEET_ID)
         
         # Get all worksheets in the spreadsheet
-        all_worksheets = spreadsheet.worksheets()
+        all_worksheets = await _sheet_call(spreadsheet.worksheets)
         
-        # Get Discord server members
-        discord_members = {member.name.lower(): member for member in guild.members}
-        discord_display_names = {member.display_name.lower(): member for member in guild.members}
+        # Get this guild's members from the event-maintained indexes
+        discord_members, discord_display_names = _member_names_of(guild)
         
         print("🔍 Starting Google Sheet member check for ALL worksheets...")
         print(f"📊 Found {len(all_worksheets)} worksheets")
@@ -973,19 +1683,43 @@ async def check_sheet_members_slash(interaction: discord.Interaction):
         total_empty = 0
         total_processed = 0
         
+        # Pull every worksheet in a single Sheets batchGet call instead of
+        # one HTTP request per worksheet
+        try:
+            # A1 notation doubles embedded single quotes in sheet titles
+            # (e.g. "Bob's Team" → 'Bob''s Team')
+            batch_response = await _sheet_call(
+                spreadsheet.values_batch_get,
+                ["'{}'".format(ws.title.replace("'", "''")) for ws in all_worksheets]
+            )
+            records_list = [
+                _values_to_records(vr.get('values', []))
+                for vr in batch_response.get('valueRanges', [])
+            ]
+        except Exception as batch_error:
+            # Surface the failure per-worksheet so the loop below reports it
+            records_list = [batch_error] * len(all_worksheets)
+
         # Check each worksheet
-        for worksheet in all_worksheets:
+        for worksheet, all_records in zip(all_worksheets, records_list):
             worksheet_name = worksheet.title
             print(f"\n📋 Checking worksheet: {worksheet_name}")
-            
+
+            if isinstance(all_records, Exception):
+                print(f"❌ Error fetching worksheet '{worksheet_name}': {str(all_records)}")
+                continue
+
             try:
-                # Get all data from this worksheet
-                all_records = worksheet.get_all_records()
-                
                 if not all_records:
                     print(f"⚠️  Worksheet '{worksheet_name}' is empty or has no data")
                     continue
-                
+
+                # Skip sheets without a Discord Username column outright:
+                # every row would just land in the empty-username bucket
+                if 'Discord Username' not in all_records[0]:
+                    print(f"⏭️ Worksheet '{worksheet_name}' has no 'Discord Username' column, skipping")
+                    continue
+
                 # Lists to track results for this worksheet
                 found_members = []
                 missing_members = []
@@ -999,46 +1733,35 @@ async def check_sheet_members_slash(interaction: discord.Interaction):
                     uwaterloo_email = record.get('UWaterloo Email', '').strip()
                     
                     if not discord_username:
-                        empty_username_rows.append({
-                            'row': i,
-                            'name': f"{first_name} {last_name}",
-                            'first_name': first_name,
-                            'last_name': last_name,
-                            'uwaterloo_email': uwaterloo_email
-                        })
+                        empty_username_rows.append(SheetMember(
+                            row=i,
+                            name=f"{first_name} {last_name}",
+                            uwaterloo_email=uwaterloo_email
+                        ))
                         continue
                     
-                    # Try to find the member in Discord
-                    found = False
-                    matched_member = None
-                    
-                    # Check by exact username match (case insensitive)
-                    if discord_username.lower() in discord_members:
-                        found = True
-                        matched_member = discord_members[discord_username.lower()]
-                    # Check by display name match (case insensitive)
-                    elif discord_username.lower() in discord_display_names:
-                        found = True
-                        matched_member = discord_display_names[discord_username.lower()]
-                    
-                    if found:
-                        found_members.append({
-                            'row': i,
-                            'name': f"{first_name} {last_name}",
-                            'discord_username': discord_username,
-                            'uwaterloo_email': uwaterloo_email,
-                            'matched_member': matched_member
-                        })
-                        print(f"✅ Found: {first_name} {last_name} ({discord_username})")
+                    # Casefold once, then one lookup per index: username
+                    # match first, display name as fallback
+                    username_key = discord_username.casefold()
+                    matched_member = (discord_members.get(username_key)
+                                      or discord_display_names.get(username_key))
+
+                    if matched_member:
+                        found_members.append(SheetMember(
+                            row=i,
+                            name=f"{first_name} {last_name}",
+                            discord_username=discord_username,
+                            uwaterloo_email=uwaterloo_email,
+                            matched_member=matched_member
+                        ))
                     else:
-                        missing_members.append({
-                            'row': i,
-                            'name': f"{first_name} {last_name}",
-                            'discord_username': discord_username,
-                            'uwaterloo_email': uwaterloo_email
-                        })
-                        print(f"❌ Missing: {first_name} {last_name} ({discord_username})")
-                
+                        missing_members.append(SheetMember(
+                            row=i,
+                            name=f"{first_name} {last_name}",
+                            discord_username=discord_username,
+                            uwaterloo_email=uwaterloo_email
+                        ))
+
                 # Store results for this worksheet
                 worksheet_results[worksheet_name] = {
                     'found': found_members,
@@ -1070,76 +1793,84 @@ async def check_sheet_members_slash(interaction: discord.Interaction):
         print(f"📊 Total records processed: {total_processed}")
         print("="*60)
         
-        # Send summary to Discord
-        summary_msg = f"📋 **Complete Google Sheet Member Check**\n"
-        summary_msg += f"📊 Worksheets checked: **{len(worksheet_results)}**\n"
-        summary_msg += f"✅ Total found: **{total_found}**\n"
-        summary_msg += f"❌ Total missing: **{total_missing}**\n"
+        # Build the summary as a list of lines; chunking happens at send
+        # time, so there is no quadratic string concatenation
+        lines = [
+            f"📋 **Complete Google Sheet Member Check**\n",
+            f"📊 Worksheets checked: **{len(worksheet_results)}**\n",
+            f"✅ Total found: **{total_found}**\n",
+            f"❌ Total missing: **{total_missing}**\n",
+        ]
         if total_empty > 0:
-            summary_msg += f"⚠️ Total empty usernames: **{total_empty}**\n"
-        summary_msg += f"📊 Total processed: **{total_processed}**\n\n"
-        
+            lines.append(f"⚠️ Total empty usernames: **{total_empty}**\n")
+        lines.append(f"📊 Total processed: **{total_processed}**\n\n")
+
         # Add detailed results for each worksheet
         for worksheet_name, results in worksheet_results.items():
             found_count = len(results['found'])
             missing_count = len(results['missing'])
             empty_count = len(results['empty'])
-            
-            summary_msg += f"📋 **{worksheet_name}**\n"
-            summary_msg += f"   ✅ Found: {found_count} | ❌ Missing: {missing_count}"
+
+            header = f"📋 **{worksheet_name}**\n   ✅ Found: {found_count} | ❌ Missing: {missing_count}"
             if empty_count > 0:
-                summary_msg += f" | ⚠️ Empty: {empty_count}"
-            summary_msg += "\n"
-            
+                header += f" | ⚠️ Empty: {empty_count}"
+            lines.append(header + "\n")
+
             # List missing members for this worksheet
             if results['missing']:
-                summary_msg += f"   Missing members:\n"
+                lines.append("   Missing members:\n")
                 for member in results['missing']:
-                    email_info = f" - {member['uwaterloo_email']}" if member['uwaterloo_email'] else ""
-                    summary_msg += f"   • {member['name']} ({member['discord_username']}){email_info}\n"
-            summary_msg += "\n"
-        
-        # Check if message is too long for Discord (2000 character limit)
-        if len(summary_msg) > 1900:  # Leave some buffer
-            # Send base summary first
-            base_msg = f"📋 **Complete Google Sheet Member Check**\n"
-            base_msg += f"📊 Worksheets checked: **{len(worksheet_results)}**\n"
-            base_msg += f"✅ Total found: **{total_found}**\n"
-            base_msg += f"❌ Total missing: **{total_missing}**\n"
-            if total_empty > 0:
-                base_msg += f"⚠️ Total empty usernames: **{total_empty}**\n"
-            base_msg += f"📊 Total processed: **{total_processed}**\n\n"
-            
-            await interaction.followup.send(base_msg)
-            
-            # Send detailed results for each worksheet in separate messages
-            for worksheet_name, results in worksheet_results.items():
-                found_count = len(results['found'])
-                missing_count = len(results['missing'])
-                empty_count = len(results['empty'])
-                
-                worksheet_msg = f"📋 **{worksheet_name}**\n"
-                worksheet_msg += f"✅ Found: {found_count} | ❌ Missing: {missing_count}"
-                if empty_count > 0:
-                    worksheet_msg += f" | ⚠️ Empty: {empty_count}"
-                worksheet_msg += "\n\n"
-                
-                # Add missing members
-                if results['missing']:
-                    worksheet_msg += f"❌ **Missing members:**\n"
-                    for member in results['missing']:
-                        email_info = f" - {member['uwaterloo_email']}" if member['uwaterloo_email'] else ""
-                        line = f"• {member['name']} ({member['discord_username']}){email_info}\n"
-                        if len(worksheet_msg + line) > 1900:
-                            await interaction.followup.send(worksheet_msg)
-                            worksheet_msg = f"📋 **{worksheet_name}** (continued)\n" + line
-                        else:
-                            worksheet_msg += line
-                
-                if worksheet_msg.strip():
-                    await interaction.followup.send(worksheet_msg)
+                    email_info = f" - {member.uwaterloo_email}" if member.uwaterloo_email else ""
+                    lines.append(f"   • {member.name} ({member.discord_username}){email_info}\n")
+            lines.append("\n")
+
+        # Prefer a single embed (6000 chars across 25 fields) so the whole
+        # report goes out in one REST call instead of several follow-ups
+        embed = discord.Embed(
+            title="📋 Complete Google Sheet Member Check",
+            description=(f"📊 Worksheets checked: **{len(worksheet_results)}**\n"
+                         f"✅ Total found: **{total_found}**\n"
+                         f"❌ Total missing: **{total_missing}**\n"
+                         + (f"⚠️ Total empty usernames: **{total_empty}**\n" if total_empty > 0 else "")
+                         + f"📊 Total processed: **{total_processed}**")
+        )
+        embed_fits = True
+        embed_len = len(embed.title) + len(embed.description)
+        for worksheet_name, results in worksheet_results.items():
+            found_count = len(results['found'])
+            missing_count = len(results['missing'])
+            empty_count = len(results['empty'])
+
+            value_lines = [f"✅ Found: {found_count} | ❌ Missing: {missing_count}"
+                           + (f" | ⚠️ Empty: {empty_count}" if empty_count > 0 else "")]
+            if results['missing']:
+                value_lines.append("Missing members:")
+                for member in results['missing']:
+                    email_info = f" - {member.uwaterloo_email}" if member.uwaterloo_email else ""
+                    value_lines.append(f"• {member.name} ({member.discord_username}){email_info}")
+            value = "\n".join(value_lines)
+
+            if (len(value) > 1024 or len(embed.fields) >= 25
+                    or embed_len + len(worksheet_name) + len(value) > 5900):
+                embed_fits = False
+                break
+            embed.add_field(name=f"📋 {worksheet_name}", value=value, inline=False)
+            embed_len += len(worksheet_name) + len(value)
+
+        if embed_fits:
+            await interaction.followup.send(embed=embed)
         else:
-            await interaction.followup.send(summary_msg)
+            # Report too large for one embed: attach the full text as a
+            # file — one webhook call instead of a burst of chunked
+            # messages against the 5 req/s bucket
+            report = "".join(lines).replace("**", "")
+            buf = io.BytesIO(report.encode("utf-8"))
+            await interaction.followup.send(
+                content=(f"📋 **Complete Google Sheet Member Check** — "
+                         f"✅ {total_found} found, ❌ {total_missing} missing "
+                         f"(full report attached)"),
+                file=discord.File(buf, filename="sheet_check.txt")
+            )
         
     except Exception as e:
         error_msg = f"❌ Error checking sheet members: {str(e)}"
@@ -1260,5 +1991,15 @@ async def reload_mappings_slash(interaction: discord.Interaction):
 # BOT STARTUP
 # ================================================================================================
 
+# Close the shared Outline HTTP session as part of bot shutdown
+_bot_close = bot.close
+
+async def _close_bot():
+    if outline_api:
+        await outline_api.close()
+    await _bot_close()
+
+bot.close = _close_bot
+
 # Start the bot
 bot.run(TOKEN)
\ No newline at end of file
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Deployment readiness checks for the Electrium status bot.
+
+Validates everything bot.py needs at startup — config files, environment
+variables, credentials, dependencies and Python syntax — so a broken
+deploy fails here instead of at runtime.
+
+Usage:
+    python deploy_check.py          # stop at the first failing check
+    python deploy_check.py --all    # run every check (CI visibility)
+"""
+
+import ast
+import io
+import json
+import os
+import re
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# orjson parses straight from bytes and is much faster; fall back to the
+# stdlib when it isn't installed (it's not in requirements.txt).
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Files bot.py expects alongside it
+REQUIRED_FILES = [
+    "bot.py",
+    "auto_sync_outline.py",
+    ".env",
+    "credentials.json",
+    "role_mapping.json",
+    "requirements.txt",
+]
+
+# Environment variables bot.py reads at startup
+REQUIRED_ENV_VARS = ["DISCORD_TOKEN", "GOOGLE_SHEETS_ID", "WORKSHEET_NAME"]
+
+# Packages from requirements.txt the bot imports directly
+KEY_PACKAGES = ["discord.py", "python-dotenv", "gspread", "aiohttp"]
+
+# Fields a Google service-account key must carry
+REQUIRED_CRED_FIELDS = frozenset({
+    "type", "project_id", "private_key_id", "private_key", "client_email",
+})
+
+# Memoized check results from the previous run, keyed by input file
+# (mtime_ns, size) signatures so unchanged files are not re-validated
+CACHE_FILE = ".deploy_check_cache.json"
+
+# Which files each check reads, for cache invalidation
+CHECK_INPUTS = {
+    "required files": REQUIRED_FILES,
+    "environment file": [".env"],
+    "role mapping": ["role_mapping.json"],
+    "credentials": ["credentials.json"],
+    "requirements": ["requirements.txt"],
+    "python syntax": ["bot.py", "auto_sync_outline.py"],
+}
+
+COLORS = {
+    "INFO": "\033[0;34m",
+    "OK": "\033[0;32m",
+    "WARN": "\033[1;33m",
+    "FAIL": "\033[0;31m",
+}
+RESET = "\033[0m"
+
+# Fully rendered "[STATUS] " prefixes, built once so each print is a
+# dict lookup and a concatenation instead of re-assembling the escapes
+_STATUS_PREFIXES = {
+    status: f"{color}[{status}]{RESET} " for status, color in COLORS.items()
+}
+
+# Leading package name on each requirements.txt line; comments and
+# blank lines simply don't match
+_REQUIREMENT_RE = re.compile(r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)", re.MULTILINE)
+
+# KEY=value lines in .env (skips blanks and comments in one pass)
+_ENV_LINE_RE = re.compile(r"^\s*([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(\S[^\n]*?)\s*$", re.MULTILINE)
+
+# Per-thread output buffer so checks running in worker threads don't
+# interleave their lines; set by _run_check, unset on the main thread
+_output = threading.local()
+
+def print_status(message, status="INFO"):
+    """Print a message with a colored status prefix."""
+    prefix = _STATUS_PREFIXES.get(status) or f"[{status}] "
+    line = prefix + message
+    buffer = getattr(_output, "buffer", None)
+    if buffer is not None:
+        buffer.write(line + "\n")
+    else:
+        print(line)
+
+def _run_check(check_func, artifacts):
+    """Run one check with its output buffered; returns (ok, output)."""
+    _output.buffer = buffer = io.StringIO()
+    try:
+        ok = check_func(artifacts)
+    finally:
+        _output.buffer = None
+    return ok, buffer.getvalue()
+
+def _slurp(path, size):
+    """Read a small file with raw fd syscalls (no buffered-IO wrapper)."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
+def load_artifacts():
+    """Read every required file into memory in one pass.
+
+    Returns (artifacts, signatures): artifacts maps file name to its
+    bytes (missing files are absent) so each check works from this
+    snapshot instead of reopening the same files; signatures maps file
+    name to (mtime_ns, size) for result memoization.
+    """
+    # One directory read instead of a stat syscall per file; scandir
+    # entries carry the stat info we need for signatures for free
+    entries = {entry.name: entry for entry in os.scandir(".")}
+    artifacts = {}
+    signatures = {}
+    for name in REQUIRED_FILES:
+        entry = entries.get(name)
+        if entry is None:
+            continue
+        stat = entry.stat()
+        signatures[name] = [stat.st_mtime_ns, stat.st_size]
+        # The stat already told us the size, so one read() suffices
+        artifacts[name] = _slurp(name, stat.st_size)
+    return artifacts, signatures
+
+def _load_cache():
+    """Load memoized check results from the last run."""
+    try:
+        with open(CACHE_FILE, "rb") as f:
+            cache = json.loads(f.read())
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+def _save_cache(cache):
+    """Persist check results for the next run (best effort)."""
+    try:
+        with open(CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+
+def check_required_files(artifacts):
+    """Check that every file the bot needs exists."""
+    missing = [f for f in REQUIRED_FILES if f not in artifacts]
+    if missing:
+        for name in missing:
+            print_status(f"Missing required file: {name}", "FAIL")
+        return False
+    print_status(f"All {len(REQUIRED_FILES)} required files present", "OK")
+    return True
+
+def check_env_file(artifacts):
+    """Check that .env defines every variable the bot reads."""
+    raw = artifacts.get(".env")
+    if raw is None:
+        print_status(".env not found", "FAIL")
+        return False
+    env_vars = dict(_ENV_LINE_RE.findall(raw.decode("utf-8")))
+
+    missing = [v for v in REQUIRED_ENV_VARS if not env_vars.get(v)]
+    if missing:
+        for name in missing:
+            print_status(f".env is missing {name}", "FAIL")
+        return False
+    print_status("All required environment variables set", "OK")
+    return True
+
+def check_role_mapping(artifacts):
+    """Check that role_mapping.json parses and has the expected shape."""
+    raw = artifacts.get("role_mapping.json")
+    if raw is None:
+        # bot.py treats a missing mapping as "role mapping disabled"
+        print_status("role_mapping.json not found (role mapping disabled)", "WARN")
+        return True
+    try:
+        config = _json_loads(raw)
+    except json.JSONDecodeError as e:
+        print_status(f"role_mapping.json is not valid JSON: {e}", "FAIL")
+        return False
+
+    if "role_mappings" not in config:
+        print_status("role_mapping.json has no 'role_mappings' key", "FAIL")
+        return False
+    print_status(f"role_mapping.json OK ({len(config['role_mappings'])} categories)", "OK")
+    return True
+
+def check_credentials(artifacts):
+    """Check that credentials.json looks like a service-account key."""
+    raw = artifacts.get("credentials.json")
+    if raw is None:
+        print_status("credentials.json not found", "FAIL")
+        return False
+    try:
+        creds = _json_loads(raw)
+    except json.JSONDecodeError as e:
+        print_status(f"credentials.json is not valid JSON: {e}", "FAIL")
+        return False
+
+    # Set difference beats a membership loop and reads as the intent
+    missing = REQUIRED_CRED_FIELDS - creds.keys()
+    if missing:
+        print_status(f"credentials.json missing fields: {', '.join(sorted(missing))}", "FAIL")
+        return False
+    if creds.get("type") != "service_account":
+        print_status("credentials.json is not a service-account key", "FAIL")
+        return False
+    print_status("credentials.json OK", "OK")
+    return True
+
+def check_requirements(artifacts):
+    """Check that requirements.txt still lists the packages the bot imports."""
+    raw = artifacts.get("requirements.txt")
+    if raw is None:
+        print_status("requirements.txt not found", "FAIL")
+        return False
+    names = {name.lower() for name in _REQUIREMENT_RE.findall(raw.decode("utf-8"))}
+    missing = {p.lower() for p in KEY_PACKAGES} - names
+    if missing:
+        print_status(f"requirements.txt missing: {', '.join(sorted(missing))}", "FAIL")
+        return False
+    print_status("requirements.txt OK", "OK")
+    return True
+
+def check_python_syntax(artifacts):
+    """Check that the bot's Python sources compile."""
+    ok = True
+    for path in ("bot.py", "auto_sync_outline.py"):
+        source = artifacts.get(path)
+        if source is None:
+            print_status(f"{path} not found", "FAIL")
+            ok = False
+            continue
+        try:
+            # Parsing alone catches syntax errors; no need to spend
+            # time generating bytecode we throw away
+            ast.parse(source, filename=path)
+            print_status(f"{path} compiles", "OK")
+        except SyntaxError as e:
+            print_status(f"{path} has a syntax error: {e}", "FAIL")
+            ok = False
+    return ok
+
+def main(fail_fast=True):
+    """Run the deploy checks and exit non-zero if any fails.
+
+    With fail_fast (the default) the first failure stops the run so a
+    broken deploy is reported immediately; --all runs everything.
+    """
+    print_status("Running deployment checks...", "INFO")
+    artifacts, signatures = load_artifacts()
+    cache = _load_cache()
+    checks = [
+        ("required files", check_required_files),
+        ("environment file", check_env_file),
+        ("role mapping", check_role_mapping),
+        ("credentials", check_credentials),
+        ("requirements", check_requirements),
+        ("python syntax", check_python_syntax),
+    ]
+
+    failed = 0
+    with ThreadPoolExecutor(max_workers=len(checks)) as pool:
+        pending = []
+        for check_name, check_func in checks:
+            sig = [[name] + signatures[name]
+                   for name in CHECK_INPUTS[check_name] if name in signatures]
+            # Only passes are memoized; failures always rerun in full
+            if cache.get(check_name) == {"sig": sig, "ok": True}:
+                pending.append((check_name, sig, None))
+            else:
+                pending.append((check_name, sig,
+                                pool.submit(_run_check, check_func, artifacts)))
+
+        # Print in submission order so output stays deterministic even
+        # though the checks themselves ran concurrently
+        for check_name, sig, future in pending:
+            print_status(f"--- {check_name} ---", "INFO")
+            if future is None:
+                print_status(f"{check_name} unchanged since last run", "OK")
+                continue
+            ok, output = future.result()
+            # One write per check instead of one per line
+            sys.stdout.write(output)
+            if ok:
+                cache[check_name] = {"sig": sig, "ok": True}
+            else:
+                cache.pop(check_name, None)
+                failed += 1
+                if fail_fast:
+                    print_status("Stopping at first failure (use --all to run every check)", "FAIL")
+                    break
+    _save_cache(cache)
+
+    if failed:
+        print_status(f"{failed} check(s) failed", "FAIL")
+        sys.exit(1)
+    print_status("All deployment checks passed", "OK")
+
+if __name__ == "__main__":
+    main(fail_fast="--all" not in sys.argv[1:])
@@ -39,136 +39,122 @@ class TestOutlineAPI:
             'Content-Type': 'application/json',
             'Accept': 'application/json'
         }
-    
+        self._session = None
+
+    async def __aenter__(self):
+        """Open one session reused by every test (headers set once)."""
+        self._session = aiohttp.ClientSession(headers=self.headers)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        """Close the shared session."""
+        await self._session.close()
+        self._session = None
+
     async def _make_request(self, endpoint, data=None):
         """
         Make an HTTP request to the Outline API.
-        
+
         Args:
             endpoint: API endpoint (e.g., 'groups.list')
             data: Request payload data
-            
+
         Returns:
             dict: API response data or None if error
         """
         # API URL already includes /api path, so just append endpoint
         url = f"{self.api_url}/{endpoint}"
-        
+
         try:
-            async with aiohttp.ClientSession() as session:
-                if data:
-                    async with session.post(url, headers=self.headers, json=data) as response:
-                        if response.status == 200:
-                            return await response.json()
-                        else:
-                            print(f"❌ API Error {response.status}: {await response.text()}")
-                            return None
+            async with self._session.post(url, json=data) as response:
+                if response.status == 200:
+                    return await response.json()
                 else:
-                    async with session.post(url, headers=self.headers) as response:
-                        if response.status == 200:
-                            return await response.json()
-                        else:
-                            print(f"❌ API Error {response.status}: {await response.text()}")
-                            return None
+                    # Only the first 512 bytes are worth printing; don't
+                    # buffer an arbitrarily large error page
+                    body = (await response.content.read(512)).decode('utf-8', 'replace')
+                    print(f"❌ API Error {response.status}: {body}")
+                    return None
         except Exception as e:
             print(f"❌ Request failed: {str(e)}")
             return None
     
+    @staticmethod
+    def _unwrap(response, key):
+        """
+        Normalize a list response's payload.
+
+        The API returns either {'data': [...]} or {'data': {key: [...]}};
+        both shapes come back as a plain list.
+        """
+        data = response.get('data')
+        if isinstance(data, dict):
+            items = data.get(key)
+            return items if isinstance(items, list) else []
+        if isinstance(data, list):
+            return data
+        return []
+
     async def test_groups_list(self):
         """Test groups.list endpoint."""
         print("🔍 Testing groups.list...")
         response = await self._make_request('groups.list')
         if response:
             print(f"✅ groups.list successful")
-            if 'data' in response:
-                groups_data = response['data']
-                if isinstance(groups_data, dict) and 'groups' in groups_data:
-                    groups = groups_data['groups']
-                elif isinstance(groups_data, list):
-                    groups = groups_data
-                else:
-                    groups = []
-                print(f"   Found {len(groups)} groups")
-                return groups
-            return []
+            groups = self._unwrap(response, 'groups')
+            print(f"   Found {len(groups)} groups")
+            return groups
         return None
-    
+
     async def test_users_list(self):
         """Test users.list endpoint."""
         print("🔍 Testing users.list...")
         response = await self._make_request('users.list')
         if response:
             print(f"✅ users.list successful")
-            if 'data' in response:
-                users_data = response['data']
-                if isinstance(users_data, dict) and 'users' in users_data:
-                    users = users_data['users']
-                elif isinstance(users_data, list):
-                    users = users_data
-                else:
-                    users = []
-                print(f"   Found {len(users)} users")
-                return users
-            return []
+            users = self._unwrap(response, 'users')
+            print(f"   Found {len(users)} users")
+            return users
         return None
     
-    async def test_groups_add_user(self, group_id, user_id, dry_run=True):
+    async def _group_user_op(self, endpoint, group_id, user_id, dry_run=True):
         """
-        Test groups.add_user endpoint with correct parameters.
-        
+        Test a groups.add_user/groups.remove_user style endpoint with
+        correct parameters.
+
         Args:
+            endpoint: API endpoint (e.g., 'groups.add_user')
             group_id: Group UUID
             user_id: User UUID
             dry_run: If True, only validate parameters without making actual request
         """
-        print(f"🔍 Testing groups.add_user (dry_run={dry_run})...")
-        
+        print(f"🔍 Testing {endpoint} (dry_run={dry_run})...")
+
         # Validate parameter format
         data = {
             'id': group_id,      # Correct parameter name (not 'groupId')
             'userId': user_id    # Correct parameter name
         }
-        
+
         print(f"   Parameters: {json.dumps(data, indent=2)}")
-        
+
         if dry_run:
             print("✅ Parameter validation passed (dry run)")
             return True
-        
-        response = await self._make_request('groups.add_user', data)
+
+        response = await self._make_request(endpoint, data)
         if response:
-            print("✅ groups.add_user successful")
+            print(f"✅ {endpoint} successful")
             return True
         return False
-    
+
+    async def test_groups_add_user(self, group_id, user_id, dry_run=True):
+        """Test groups.add_user endpoint with correct parameters."""
+        return await self._group_user_op('groups.add_user', group_id, user_id, dry_run)
+
     async def test_groups_remove_user(self, group_id, user_id, dry_run=True):
-        """
-        Test groups.remove_user endpoint with correct parameters.
-        
-        Args:
-            group_id: Group UUID
-            user_id: User UUID
-            dry_run: If True, only validate parameters without making actual request
-        """
-        print(f"🔍 Testing groups.remove_user (dry_run={dry_run})...")
-        
-        # Validate parameter format
-        data = {
-            'id': group_id,      # Correct parameter name (not 'groupId')
-            'userId': user_id    # Correct parameter name
-        }
-        
-        print(f"   Parameters: {json.dumps(data, indent=2)}")
-        
-        if dry_run:
-            print("✅ Parameter validation passed (dry run)")
-            return True
-        
-        response = await self._make_request('groups.remove_user', data)
-        if response:
-            print("✅ groups.remove_user successful")
-            return True
-        return False
+        """Test groups.remove_user endpoint with correct parameters."""
+        return await self._group_user_op('groups.remove_user', group_id, user_id, dry_run)
 
 async def main():
     """Main test function."""
@@ -179,58 +165,59 @@ async def main():
         print("❌ Error: OUTLINE_API_URL and OUTLINE_API_TOKEN must be set in .env")
         return
     
-    # Initialize test client
-    test_api = TestOutlineAPI(OUTLINE_API_URL, OUTLINE_API_TOKEN)
-    
-    # Test basic endpoints
-    print("=" * 50)
-    print("BASIC ENDPOINT TESTS")
-    print("=" * 50)
+    # Initialize test client; one session shared by every request
+    async with TestOutlineAPI(OUTLINE_API_URL, OUTLINE_API_TOKEN) as test_api:
+        # Test basic endpoints
+        print("=" * 50)
+        print("BASIC ENDPOINT TESTS")
+        print("=" * 50)
     
-    groups = await test_api.test_groups_list()
-    if groups is None:
-        print("❌ Cannot proceed without groups data")
-        return
-    
-    users = await test_api.test_users_list()
-    if users is None:
-        print("❌ Cannot proceed without users data")
-        return
+        # The two list endpoints are independent; fetch them concurrently
+        groups, users = await asyncio.gather(
+            test_api.test_groups_list(),
+            test_api.test_users_list()
+        )
+        if groups is None:
+            print("❌ Cannot proceed without groups data")
+            return
+        if users is None:
+            print("❌ Cannot proceed without users data")
+            return
     
-    print()
+        print()
     
-    # Test parameter validation (dry run)
-    print("=" * 50)
-    print("PARAMETER VALIDATION TESTS (DRY RUN)")
-    print("=" * 50)
+        # Test parameter validation (dry run)
+        print("=" * 50)
+        print("PARAMETER VALIDATION TESTS (DRY RUN)")
+        print("=" * 50)
     
-    if groups and users:
-        # Use first available group and user for testing
-        test_group = groups[0]
-        test_user = users[0]
+        if groups and users:
+            # Use first available group and user for testing
+            test_group = groups[0]
+            test_user = users[0]
         
-        group_id = test_group.get('id')
-        user_id = test_user.get('id')
+            group_id = test_group.get('id')
+            user_id = test_user.get('id')
         
-        if group_id and user_id:
-            print(f"Using test group: {test_group.get('name', 'Unknown')} ({group_id})")
-            print(f"Using test user: {test_user.get('name', 'Unknown')} ({user_id})")
-            print()
+            if group_id and user_id:
+                print(f"Using test group: {test_group.get('name', 'Unknown')} ({group_id})")
+                print(f"Using test user: {test_user.get('name', 'Unknown')} ({user_id})")
+                print()
             
-            # Test parameter formats (dry run only)
-            await test_api.test_groups_add_user(group_id, user_id, dry_run=True)
-            await test_api.test_groups_remove_user(group_id, user_id, dry_run=True)
+                # Test parameter formats (dry run only)
+                await test_api.test_groups_add_user(group_id, user_id, dry_run=True)
+                await test_api.test_groups_remove_user(group_id, user_id, dry_run=True)
+            else:
+                print("❌ Missing group ID or user ID for parameter testing")
         else:
-            print("❌ Missing group ID or user ID for parameter testing")
-    else:
-        print("❌ No groups or users available for parameter testing")
+            print("❌ No groups or users available for parameter testing")
     
-    print()
-    print("🎉 API tests completed!")
-    print("\nSummary:")
-    print("- Fixed endpoint names: groups.addUser → groups.add_user, groups.removeUser → groups.remove_user")
-    print("- Fixed parameter names: groupId → id, userId remains userId")
-    print("- Added interaction.response.defer() to prevent Discord timeouts")
+        print()
+        print("🎉 API tests completed!")
+        print("\nSummary:")
+        print("- Fixed endpoint names: groups.addUser → groups.add_user, groups.removeUser → groups.remove_user")
+        print("- Fixed parameter names: groupId → id, userId remains userId")
+        print("- Added interaction.response.defer() to prevent Discord timeouts")
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file